@@ -0,0 +1,518 @@
+#!/usr/bin/env python
+"""
+Automate the mechanical parts of the nose -> pytest migration described
+in docs/nose_to_pytest_guide.md.
+
+The script applies a table of regex transformations (nose imports,
+``@raises``, unittest-style assertions, ...) to the test files that
+still use nose, verifies each migrated file by running pytest on it,
+and records progress via contracts_nose_pytest_migration.py.
+
+Usage:
+    python auto_migrate_nose_to_pytest.py scan      # report what would change
+    python auto_migrate_nose_to_pytest.py migrate   # rewrite, verify, track
+    python auto_migrate_nose_to_pytest.py verify    # re-run migrated files
+"""
+import argparse
+import contextlib
+import io
+import mmap
+import os
+import re
+import shutil
+import sys
+import tempfile
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import pytest
+
+import contracts_nose_pytest_migration as _tracker
+
+# Optional: with pyahocorasick installed, one automaton pass over a file
+# yields the set of rules that can match, instead of one substring
+# search per rule.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+_PREFIX_LEN = len(PROJECT_ROOT) + 1
+
+
+def _rel_path(file_path):
+    """Project-relative path for display.
+
+    Every discovered file lives under PROJECT_ROOT, so a prefix slice
+    replaces the full path decomposition os.path.relpath would do.
+    """
+    return file_path[_PREFIX_LEN:]
+
+NOSE_IMPORT_PATTERNS = ('import nose', 'from nose', 'nose.tools')
+
+# Byte-level view of the markers for the mmap scan in is_nose_test.
+_NOSE_BYTE_PATTERNS = tuple(p.encode('utf-8') for p in NOSE_IMPORT_PATTERNS)
+
+# Each transformation maps a nose/unittest idiom to its pytest
+# equivalent; see docs/nose_to_pytest_guide.md section 2 for the
+# rationale behind each rewrite.
+TRANSFORMATIONS = [
+    {
+        'description': "Replace 'from nose.tools import ...' with 'import pytest'",
+        'literal': 'from nose.tools',
+        'pattern': r'from\s+nose\.tools\s+import\s+[^\n]+',
+        'replacement': 'import pytest',
+    },
+    {
+        'description': "Replace 'from nose import ...' with 'import pytest'",
+        'literal': 'from nose',
+        'pattern': r'from\s+nose\s+import\s+[^\n]+',
+        'replacement': 'import pytest',
+    },
+    {
+        'description': "Replace 'import nose' with 'import pytest'",
+        'literal': 'import nose',
+        'pattern': r'import\s+nose\b(?!\S)',
+        'replacement': 'import pytest',
+    },
+    {
+        'description': "Remove @istest decorators",
+        'literal': '@istest',
+        'pattern': r'@istest\s*\n',
+        'replacement': '',
+    },
+    {
+        'description': "Convert @nottest to @pytest.mark.skip",
+        'literal': '@nottest',
+        'pattern': r'@nottest\b',
+        'replacement': '@pytest.mark.skip',
+    },
+    {
+        'description': "Convert @raises(...) to @pytest.mark.xfail(raises=...)",
+        'literal': '@raises(',
+        'pattern': r'@raises\(([^)]+)\)',
+        'replacement': r'@pytest.mark.xfail(raises=\1)',
+    },
+    {
+        'description': "Convert self.assertEqual to plain assert",
+        'literal': 'self.assertEqual',
+        'pattern': r'self\.assertEqual\(([^,]+),\s*([^)]+)\)',
+        'replacement': r'assert \1 == \2',
+    },
+    {
+        'description': "Convert self.assertNotEqual to plain assert",
+        'literal': 'self.assertNotEqual',
+        'pattern': r'self\.assertNotEqual\(([^,]+),\s*([^)]+)\)',
+        'replacement': r'assert \1 != \2',
+    },
+    {
+        'description': "Convert self.assertTrue to plain assert",
+        'literal': 'self.assertTrue',
+        'pattern': r'self\.assertTrue\(([^)]+)\)',
+        'replacement': r'assert \1',
+    },
+    {
+        'description': "Convert self.assertFalse to plain assert",
+        'literal': 'self.assertFalse',
+        'pattern': r'self\.assertFalse\(([^)]+)\)',
+        'replacement': r'assert not \1',
+    },
+    {
+        'description': "Convert self.assertIn to plain assert",
+        'literal': 'self.assertIn',
+        'pattern': r'self\.assertIn\(([^,]+),\s*([^)]+)\)',
+        'replacement': r'assert \1 in \2',
+    },
+    {
+        'description': "Convert self.assertIsNone to plain assert",
+        'literal': 'self.assertIsNone',
+        'pattern': r'self\.assertIsNone\(([^)]+)\)',
+        'replacement': r'assert \1 is None',
+    },
+    {
+        'description': "Convert one-line self.assertRaises to pytest.raises",
+        'literal': 'self.assertRaises',
+        'pattern': r'self\.assertRaises\(([^,]+),\s*([^,)]+)\)',
+        'replacement': r'pytest.raises(\1, \2)',
+    },
+    {
+        'description': "Drop unittest.TestCase base class",
+        'literal': 'unittest.TestCase',
+        'pattern': r'\(unittest\.TestCase\)',
+        'replacement': '(object)',
+    },
+    {
+        'description': "Rename setUp to setup_method",
+        'literal': 'setUp(',
+        'pattern': r'def\s+setUp\(self\):',
+        'replacement': 'def setup_method(self):',
+    },
+    {
+        'description': "Rename tearDown to teardown_method",
+        'literal': 'tearDown(',
+        'pattern': r'def\s+tearDown\(self\):',
+        'replacement': 'def teardown_method(self):',
+    },
+    {
+        'description': "Convert @expected_failure to @pytest.mark.xfail",
+        'literal': '@expected_failure',
+        'pattern': r'@expected_failure\b',
+        'replacement': '@pytest.mark.xfail',
+    },
+    # The two block rules below consume whole lines with a lookahead per
+    # newline instead of DOTALL '.*?', so matching stays linear and a
+    # large file can never trigger pathological backtracking.
+    {
+        'description': "Remove the expected_failure helper definition",
+        'literal': 'expected_failure',
+        'pattern': (r'def\s+expected_failure\(test\):[^\n]*'
+                    r'(?:\n(?!def\s|class\s|if\s+__name__)[^\n]*)*\n?'),
+        'replacement': '',
+        'multiline': True,
+    },
+    {
+        'description': "Replace nose test runner block with pytest.main",
+        'literal': 'nose.',
+        'pattern': (r'if\s+__name__\s*==\s*.__main__.:[^\n]*\n'
+                    r'(?:[ \t]+(?!nose\.)[^\n]*\n)*'
+                    r'[ \t]+nose\.(?:runmodule|main|run)\(\)[^\n]*\n?'),
+        'replacement': "if __name__ == '__main__':\n    pytest.main([__file__])\n",
+        'multiline': True,
+    },
+]
+
+# Compile every pattern once at import time: analyze/migrate run each
+# rule against every file, so per-call re.compile lookups add up.
+for _transform in TRANSFORMATIONS:
+    _transform['compiled'] = re.compile(_transform['pattern'],
+                                        _transform.get('flags', 0))
+
+# The single-line rules do not interact with each other, so migrate_file
+# applies them all in one pass over the file via an alternation of named
+# groups instead of one full scan per rule.  The block rules span lines
+# and stay as separate passes.
+_SINGLE_PASS_RULES = [t for t in TRANSFORMATIONS if not t.get('multiline')]
+_MULTILINE_RULES = [t for t in TRANSFORMATIONS if t.get('multiline')]
+MASTER_PATTERN = re.compile('|'.join(
+    '(?P<r%d>%s)' % (i, t['pattern']) for i, t in enumerate(_SINGLE_PASS_RULES)))
+
+PYTEST_IMPORT_RE = re.compile(r'import\s+pytest')
+
+_SINGLE_PASS_INDICES = {index for index, t in enumerate(TRANSFORMATIONS)
+                        if not t.get('multiline')}
+_MULTILINE_INDICES = {index for index, t in enumerate(TRANSFORMATIONS)
+                      if t.get('multiline')}
+
+if ahocorasick is not None:
+    _RULE_AUTOMATON = ahocorasick.Automaton()
+    for _index, _transform in enumerate(TRANSFORMATIONS):
+        _RULE_AUTOMATON.add_word(_transform['literal'], _index)
+    _RULE_AUTOMATON.make_automaton()
+else:
+    _RULE_AUTOMATON = None
+
+
+def _candidate_rule_indices(content):
+    """Indices of the rules whose literal anchor occurs in content."""
+    if _RULE_AUTOMATON is not None:
+        return {index for _end, index in _RULE_AUTOMATON.iter(content)}
+    return {index for index, transform in enumerate(TRANSFORMATIONS)
+            if transform['literal'] in content}
+
+
+def _replace_master_match(match, counts):
+    """Dispatch one MASTER_PATTERN match to the rule that produced it."""
+    rule = _SINGLE_PASS_RULES[int(match.lastgroup[1:])]
+    counts[rule['description']] = counts.get(rule['description'], 0) + 1
+    # Re-run the rule's own pattern on the matched span so its numbered
+    # backreferences expand correctly (the master regex renumbers groups).
+    return rule['compiled'].sub(rule['replacement'], match.group(0))
+
+
+def _read_if_nose(file_path):
+    """The file's content if it still uses nose, else None.
+
+    Maps the file instead of reading it: the kernel pages data in
+    lazily and mmap.find scans contiguous memory with no userspace
+    copy.  A single find of 'nose' gates the three marker checks, and
+    only files that pass are decoded (once, to be reused downstream).
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if mapped.find(b'nose') == -1:
+                return None
+            if not any(mapped.find(pattern) != -1
+                       for pattern in _NOSE_BYTE_PATTERNS):
+                return None
+            return mapped[:].decode('utf-8')
+        finally:
+            mapped.close()
+
+
+def is_nose_test(file_path):
+    """True if the file still imports or uses nose."""
+    return _read_if_nose(file_path) is not None
+
+
+@lru_cache(maxsize=None)
+def _find_nose_test_files_cached():
+    # os.scandir with an explicit stack instead of os.walk: DirEntry
+    # caches the file type from the directory read, so no per-entry
+    # stat calls, and the nose check runs inline during the walk.
+    nose_files = []
+    stack = [os.path.join(PROJECT_ROOT, 'src')]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (entry.name.startswith('test_')
+                        and entry.name.endswith('.py')):
+                    content = _read_if_nose(entry.path)
+                    if content is not None:
+                        nose_files.append((entry.path, content))
+    return tuple(nose_files)
+
+
+def find_nose_test_files():
+    """Return (path, content) for all nose-dependent test files under src/.
+
+    The detection scan has already read each file, so the content rides
+    along and analyze/migrate do not reopen it.  The walk is cached for
+    the lifetime of the process so successive commands (scan followed
+    by migrate) do not re-traverse src/.
+    """
+    return list(_find_nose_test_files_cached())
+
+
+def analyze_file(file_path, content=None):
+    """Report which transformations would apply to a file, without writing."""
+    if content is None:
+        with open(file_path, 'r') as f:
+            content = f.read()
+    findings = []
+    for index in sorted(_candidate_rule_indices(content)):
+        transform = TRANSFORMATIONS[index]
+        matches = transform['compiled'].findall(content)
+        if matches:
+            findings.append({'description': transform['description'],
+                             'matches': len(matches)})
+    return findings
+
+
+def create_backup(file_path):
+    """Keep the original aside so a failed migration can be undone.
+
+    A hardlink shares the original's data blocks (the migration writes
+    the new content to a fresh inode, so the link keeps the old bytes);
+    platforms without hardlinks get a plain copy.
+    """
+    backup_path = file_path + '.nose.bak'
+    if os.path.exists(backup_path):
+        os.remove(backup_path)
+    try:
+        os.link(file_path, backup_path)
+    except OSError:
+        shutil.copy2(file_path, backup_path)
+    return backup_path
+
+
+def restore_from_backup(file_path):
+    backup_path = file_path + '.nose.bak'
+    shutil.copy2(backup_path, file_path)
+    os.remove(backup_path)
+
+
+def migrate_file(file_path, content=None):
+    """Apply all transformations to a file in place.
+
+    Returns the list of modifications made, for reporting.
+    """
+    if content is None:
+        with open(file_path, 'r') as f:
+            content = f.read()
+
+    # One automaton/substring pass decides which rules run at all; no
+    # replacement ever produces another rule's literal, so the set
+    # computed on the original content stays valid.
+    candidates = _candidate_rule_indices(content)
+    counts = {}
+    transformed_content = content
+    if candidates & _SINGLE_PASS_INDICES:
+        transformed_content = MASTER_PATTERN.sub(
+            lambda match: _replace_master_match(match, counts), content)
+    modifications = [{'description': description, 'matches_replaced': count}
+                     for description, count in counts.items()]
+    for index in sorted(candidates & _MULTILINE_INDICES):
+        transform = TRANSFORMATIONS[index]
+        # subn substitutes and counts in a single scan.
+        transformed_content, replaced = transform['compiled'].subn(
+            transform['replacement'], transformed_content)
+        if replaced:
+            modifications.append({
+                'description': transform['description'],
+                'matches_replaced': replaced,
+            })
+
+    if modifications and not PYTEST_IMPORT_RE.search(transformed_content):
+        transformed_content = 'import pytest\n' + transformed_content
+        modifications.append({'description': "Add missing 'import pytest'",
+                              'matches_replaced': 1})
+
+    if transformed_content != content:
+        # Write to a sibling temp file and rename over the original, so
+        # a crash mid-write can never leave a truncated source file.
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(transformed_content)
+        os.replace(tmp_path, file_path)
+    return modifications
+
+
+def verify_migration(file_path):
+    """Run pytest on a single migrated file; returns (success, stdout, stderr).
+
+    pytest runs in-process via pytest.main, which skips interpreter and
+    import startup; when called from the worker pool the imports also
+    amortize across the files each worker handles.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        exit_code = pytest.main(['-x', '-p', 'no:cacheprovider', file_path])
+    return exit_code == 0, stdout.getvalue(), stderr.getvalue()
+
+
+def _verify_one(file_path):
+    """Worker wrapper so verification results can be collected in order."""
+    success, stdout, stderr = verify_migration(file_path)
+    return file_path, success, stdout, stderr
+
+
+def _verify_parallel(file_paths):
+    """Verify files on all cores; printing stays on the main thread."""
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_verify_one, file_paths))
+
+
+def update_migration_status(file_paths):
+    """Record successful migrations in the tracking file, in one batch."""
+    _tracker.bulk_update_test_status(file_paths)
+
+
+def scan_command():
+    """Show which files still use nose and what would be rewritten."""
+    nose_files = find_nose_test_files()
+    if not nose_files:
+        print("No nose-based test files found.")
+        return 0
+    for file_path, content in nose_files:
+        print(f"\n{_rel_path(file_path)}:")
+        for finding in analyze_file(file_path, content):
+            print(f"  {finding['matches']:3d} x {finding['description']}")
+    print(f"\n{len(nose_files)} file(s) still using nose.")
+    return 0
+
+
+def migrate_command():
+    """Rewrite each nose file, verify it with pytest, and track progress."""
+    nose_files = find_nose_test_files()
+    if not nose_files:
+        print("No nose-based test files found.")
+        return 0
+    for file_path, content in nose_files:
+        print(f"Migrating {_rel_path(file_path)}...")
+        create_backup(file_path)
+        modifications = migrate_file(file_path, content)
+        for modification in modifications:
+            print(f"  {modification['matches_replaced']:3d} x {modification['description']}")
+    # The verification subprocesses are independent of each other, so run
+    # them on all cores; status updates happen here afterwards to avoid
+    # races on the tracking file.
+    failures = 0
+    migrated_ok = []
+    file_paths = [file_path for file_path, _content in nose_files]
+    for file_path, success, stdout, stderr in _verify_parallel(file_paths):
+        rel_path = _rel_path(file_path)
+        if success:
+            migrated_ok.append(file_path)
+            print(f"  OK: {rel_path}")
+        else:
+            restore_from_backup(file_path)
+            failures += 1
+            print(f"  FAILED (restored from backup): {rel_path}")
+            print(stdout)
+            print(stderr, file=sys.stderr)
+    if migrated_ok:
+        update_migration_status(migrated_ok)
+    return 1 if failures else 0
+
+
+def _failed_files_from_junit(report_path, rel_paths):
+    """Map failing testcases in a JUnit report back to their source files."""
+    prefixes = {rel_path[:-3].replace(os.sep, '.'): rel_path
+                for rel_path in rel_paths}
+    failed = set()
+    for testcase in ElementTree.parse(report_path).iter('testcase'):
+        if (testcase.find('failure') is None
+                and testcase.find('error') is None):
+            continue
+        classname = testcase.get('classname', '')
+        for prefix, rel_path in prefixes.items():
+            if classname == prefix or classname.startswith(prefix + '.'):
+                failed.add(rel_path)
+    return failed
+
+
+def verify_command():
+    """Re-run pytest on every file recorded as migrated.
+
+    All files go to a single pytest invocation so collection and plugin
+    startup are paid once; per-file results come from the JUnit report.
+    """
+    status = _tracker.get_migration_status()
+    rel_paths = status['migrated_files']
+    migrated_files = [os.path.join(PROJECT_ROOT, rel_path)
+                      for rel_path in rel_paths]
+    if not migrated_files:
+        print("No migrated files recorded yet.")
+        return 0
+    report_path = os.path.join(tempfile.gettempdir(),
+                               'pytest_migration_report.xml')
+    pytest.main(['-v', '--tb=no', '-p', 'no:cacheprovider',
+                 '--junitxml=' + report_path] + migrated_files)
+    failed = _failed_files_from_junit(report_path, rel_paths)
+    for rel_path in rel_paths:
+        if rel_path in failed:
+            print(f"  FAILED: {rel_path}")
+        else:
+            print(f"  OK: {rel_path}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Automate the nose -> pytest migration")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('scan', help=scan_command.__doc__)
+    subparsers.add_parser('migrate', help=migrate_command.__doc__)
+    subparsers.add_parser('verify', help=verify_command.__doc__)
+    args = parser.parse_args()
+
+    if args.command == 'scan':
+        return scan_command()
+    if args.command == 'migrate':
+        return migrate_command()
+    if args.command == 'verify':
+        return verify_command()
+    parser.print_help()
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
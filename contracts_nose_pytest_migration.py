@@ -0,0 +1,128 @@
+#!/usr/bin/env python
+"""
+Track the progress of the nose -> pytest migration of the PyContracts
+test suite.
+
+Progress is recorded in ``.pytest_migration.json`` at the project root.
+See docs/nose_to_pytest_guide.md for the migration process itself; this
+script only answers "which files have already been migrated?".
+
+Usage:
+    python contracts_nose_pytest_migration.py status
+    python contracts_nose_pytest_migration.py update <test_file>
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+TRACKING_FILE = os.path.join(PROJECT_ROOT, '.pytest_migration.json')
+
+# Use orjson for the tracking file when available; the stdlib json
+# module is a fine fallback, just slower on the parse path.
+try:
+    import orjson
+
+    def _loads(text):
+        return orjson.loads(text)
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _loads(text):
+        return json.loads(text)
+
+    def _dumps(obj):
+        return json.dumps(obj, indent=2)
+
+
+def scan_directory_for_tests():
+    """Return all test_*.py files under src/, migrated or not."""
+    test_files = []
+    stack = [os.path.join(PROJECT_ROOT, 'src')]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (entry.name.startswith('test_')
+                        and entry.name.endswith('.py')):
+                    test_files.append(entry.path)
+    return test_files
+
+
+# Loaded once per process; every update goes through save_migration_status
+# so the cache and the file cannot diverge.
+_status_cache = None
+
+
+def get_migration_status():
+    """Load the tracking file, returning a fresh status dict if absent."""
+    global _status_cache
+    if _status_cache is None:
+        if os.path.exists(TRACKING_FILE):
+            with open(TRACKING_FILE, 'r') as f:
+                _status_cache = _loads(f.read())
+        else:
+            _status_cache = {'migrated_files': [], 'last_updated': None}
+    return _status_cache
+
+
+def save_migration_status(status):
+    status['last_updated'] = time.strftime('%Y-%m-%d %H:%M:%S')
+    with open(TRACKING_FILE, 'w') as f:
+        f.write(_dumps(status))
+
+
+def update_test_status(file_path):
+    """Mark a test file as migrated to pytest."""
+    bulk_update_test_status([file_path])
+
+
+def bulk_update_test_status(file_paths):
+    """Mark several files as migrated with a single load/save cycle."""
+    status = get_migration_status()
+    # Deduplicate through a set (list membership would be quadratic over
+    # a batch) and keep the serialized form sorted and stable.
+    migrated = set(status['migrated_files'])
+    migrated.update(os.path.relpath(os.path.abspath(file_path), PROJECT_ROOT)
+                    for file_path in file_paths)
+    status['migrated_files'] = sorted(migrated)
+    save_migration_status(status)
+
+
+def display_status():
+    status = get_migration_status()
+    all_tests = scan_directory_for_tests()
+    migrated = status['migrated_files']
+    print(f"Test files found: {len(all_tests)}")
+    print(f"Migrated to pytest: {len(migrated)}")
+    for rel_path in migrated:
+        print(f"  [done] {rel_path}")
+    if status['last_updated']:
+        print(f"Last updated: {status['last_updated']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Track nose -> pytest migration progress")
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('status', help="Show migration progress")
+    update_parser = subparsers.add_parser('update', help="Mark files as migrated")
+    update_parser.add_argument('files', nargs='+',
+                               help="Paths to the migrated test files")
+    args = parser.parse_args()
+
+    if args.command == 'update':
+        bulk_update_test_status(args.files)
+    elif args.command == 'status':
+        display_status()
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -53,7 +53,7 @@ setup(name='PyContracts',
       packages=find_packages('src'),
       install_requires=['pyparsing>=3.0.0', 'decorator', 'six', 'future'],
       tests_require=['pytest>=7.0.0', 'pytest-cov>=6.0.0', 'numpy'],
-      python_requires='>=2.7, !=3.0.*, !=3.1.*, !=3.2.*, !=3.3.*',
+      python_requires='>=3.7',
       classifiers=[
           'Development Status :: 5 - Production/Stable',
           'Intended Audience :: Developers',
@@ -61,9 +61,7 @@ setup(name='PyContracts',
           'Topic :: Software Development :: Quality Assurance',
           'Topic :: Software Development :: Documentation',
           'Topic :: Software Development :: Testing',
-          'Programming Language :: Python :: 2.7',
           'Programming Language :: Python :: 3',
-          'Programming Language :: Python :: 3.6',
           'Programming Language :: Python :: 3.7',
           'Programming Language :: Python :: 3.8',
           'Programming Language :: Python :: 3.9',
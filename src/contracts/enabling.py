@@ -1,10 +1,22 @@
 from . import logger
 import os
 
+# The environment variables are read exactly once, at import time;
+# runtime checks only touch the module-level booleans below.
+# Any non-empty value disables contracts (historical semantics).
+_DISABLED_BY_ENV = bool(os.environ.get('DISABLE_CONTRACTS', ''))
+
+# Under python -O (or PYTHONOPTIMIZE) contracts are disabled entirely,
+# so the decorator returns the undecorated function; set
+# CONTRACTS_FORCE=1 to keep validation in optimized mode.
+_FORCED_BY_ENV = os.environ.get('CONTRACTS_FORCE', '').lower() \
+    in ('1', 'true', 'yes')
+_DISABLED_BY_OPTIMIZE = (not __debug__) and not _FORCED_BY_ENV
+
 
 class Switches:
-    # default to ENV variable
-    disable_all = os.environ.get('DISABLE_CONTRACTS', False)
+    # default to ENV variable / optimized mode
+    disable_all = _DISABLED_BY_ENV or _DISABLED_BY_OPTIMIZE
 
 
 def disable_all():
@@ -17,10 +29,11 @@ def disable_all():
 def enable_all():
     """
     Enables all contracts checks.
-    Can be overridden by an environment variable.
+    Can be overridden by the environment variable read at import,
+    or by running in optimized mode.
     """
 #     print('enable_all()')
-    if not os.environ.get('DISABLE_CONTRACTS', False):
+    if not (_DISABLED_BY_ENV or _DISABLED_BY_OPTIMIZE):
         Switches.disable_all = False
         logger.info('All contracts checking enabled.')
 
@@ -29,4 +42,3 @@ def all_disabled():
 #     print('all_Disabled? %s' % Switches.disable_all)
     """ Returns true if all contracts checks are disabled. """
     return Switches.disable_all
-
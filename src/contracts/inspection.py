@@ -1,26 +1,15 @@
-import sys
 import inspect
-from .backported import getcallargs, getfullargspec
-
+from functools import lru_cache
 
-inPy2 = sys.version_info[0] == 2
-if inPy2:
-    from types import ClassType
+from .backported import getcallargs, getfullargspec
 
 
 def can_be_used_as_a_type(x):
     """ Checks that x can be used as a type; specifically,
         we can write isintance(y,x).
-        Here we support old-style classes.
+        On Python 3 every class is an instance of type.
     """
-    if isinstance(x, type):
-        return True
-
-    if inPy2:
-        if isinstance(x, ClassType):
-            return True
-
-    return False
+    return isinstance(x, type)
 
 
 def can_accept_exactly_one_argument(callable_thing):
@@ -59,10 +48,19 @@ def get_f_from_callable(callable_thing):
             # args = ('test',)
     return f
 
+@lru_cache(maxsize=1024)
+def _fullargspec_cached(f):
+    return getfullargspec(f)
+
+
 def get_callable_fullargspec(callable_thing):
+    # Keyed on the underlying function, so every bound method of a class
+    # shares one introspection; unhashable callables skip the cache.
     f = get_f_from_callable(callable_thing)
-    spec = getfullargspec(f)
-    return spec
+    try:
+        return _fullargspec_cached(f)
+    except TypeError:
+        return getfullargspec(f)
 
 def can_accept_at_least_one_argument(callable_thing):
     """ 
@@ -106,7 +104,9 @@ def can_accept_self_plus_one_argument(callable_thing):
 
 
 class InvalidArgs(Exception):
-    pass
+    # Raised once per rejected call; slots keep the instance __dict__
+    # from ever being materialized.
+    __slots__ = ()
 
 def check_callable_accepts_these_arguments(callable_thing, args, kwargs):
     """ Checks that a callable can accept the args and kwargs. 
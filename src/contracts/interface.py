@@ -6,7 +6,7 @@ from abc import ABCMeta, abstractmethod
 from .metaclass import with_metaclass
 from .py_compatibility import (
     PY3, string_types, text_type, binary_type,
-    reraise, catch_and_wrap
+    reraise, catch_and_wrap, catch_and_wrap_default
 )
 
 
@@ -19,10 +19,17 @@ class Where(object):
         
         
         Character should be >= len(string) (possibly outside the string).
-        Character_end should be >= character (so that you can splice with 
+        Character_end should be >= character (so that you can splice with
         string[character:character_end])
     """
 
+    # Every parsed element allocates one of these; slots avoid the
+    # per-instance __dict__, and the substring is sliced once here
+    # instead of on every get_substring()/printable-length call.
+    __slots__ = ('string', 'character', 'character_end',
+                 'line', 'col', 'line_end', 'col_end',
+                 'filename', '_substring')
+
     def __init__(self, string, character, character_end=None):
         from contracts.utils import raise_desc
         if not isinstance(string, string_types):
@@ -46,19 +53,20 @@ class Where(object):
         self.line, self.col = line_and_col(character, string)
 
         if character_end is not None:
-            if not (0 <= character_end <= len(string)):
-                msg = ('Invalid character_end loc %s for string of len %s.' %
-                       (character_end, len(string)))
-
+            # character <= character_end <= len(string): any violation
+            # makes one of these differences negative, so a single
+            # comparison replaces the two bounds branches.
+            if ((character_end - character)
+                    | (len(string) - character_end)) < 0:
+                msg = ('Invalid interval [%s:%s] for string of len %s.' %
+                       (character, character_end, len(string)))
                 raise_desc(ValueError, msg, string=string.__repr__())
 
-            if not (character_end >= character):
-                msg = 'Invalid interval [%d:%d]' % (character, character_end)
-                raise ValueError(msg)
-
             self.line_end, self.col_end = line_and_col(character_end, string)
+            self._substring = string[character:character_end]
         else:
             self.line_end, self.col_end = None, None
+            self._substring = None
 
         self.string = string
         self.character = character
@@ -72,12 +80,11 @@ class Where(object):
         if self.character_end is None:
             msg = 'Character end is None'
             raise_desc(ValueError, msg, where=self)
-        return self.string[self.character:self.character_end]
+        return self._substring
 
     def __repr__(self):
         if self.character_end is not None:
-            part = self.string[self.character:self.character_end]
-            return 'Where(%r)' % part
+            return 'Where(%r)' % self._substring
         else:
             return 'Where(s=...,char=%s-%s,line=%s,col=%s)' % (self.character, self.character_end, self.line, self.col)
 
@@ -159,12 +166,10 @@ def format_where(w, context_before=3, mark=None, arrow=True,
 
 def printable_length_where(w):
     """ Returns the printable length of the substring """
-    sub = w.string[w.character:w.character_end]
-    # Use the appropriate string type based on Python version
-    if PY3:
-        return len(text_type(sub))
-    else:
-        return len(text_type(sub))
+    sub = w._substring
+    if sub is None:
+        sub = w.string[w.character:w.character_end]
+    return len(sub)
 
 
 # Import string_types from our compatibility module instead of six
@@ -220,7 +225,9 @@ def location(line, col, s):
     check_isinstance(s, string_types)
 
     lines = s.split('\n')
-    previous_lines = sum(len(l) + len('\n') for l in lines[:line])
+    # map(len, ...) iterates at C level; each line also contributes
+    # one newline character, accounted for by adding `line`.
+    previous_lines = sum(map(len, lines[:line])) + line
     offset = col
     return previous_lines + offset
 
@@ -291,6 +298,11 @@ class ContractSyntaxError(ContractDefinitionError):
 class ContractNotRespected(ContractException):
     """ Exception thrown when a value does not respect a contract. """
 
+    # No __slots__ here: BaseException.__reduce__ carries args plus the
+    # instance __dict__, and the round-trip needs the __dict__ to keep
+    # the mutated state (stack entries, the "Breach for argument" prefix
+    # prepended by the checker) across processes.
+
     def __init__(self, contract, error, value, context):
         # XXX: solves pickling problem in multiprocess problem, but not the
         # real solution
@@ -418,7 +430,7 @@ class Contract(with_metaclass(ABCMeta, object)):
         def create_exception(msg):
             return ContractNotRespected(self, msg, value, {})
             
-        return catch_and_wrap(check_func, Exception, create_exception)
+        return catch_and_wrap_default(check_func, Exception, create_exception)
 
     def fail(self, value):
         """
@@ -592,7 +604,7 @@ def describe_value(x, clip=80):
         Short description, no multiline.
     """
     if hasattr(x, 'shape') and hasattr(x, 'dtype'):
-        shape_desc = 'x'.join(str(i) for i in x.shape)
+        shape_desc = 'x'.join(map(str, x.shape))
         desc = 'array[%r](%s) ' % (shape_desc, x.dtype)
         final = desc + clipped_repr(x, clip - len(desc))
         return remove_newlines(final)
@@ -608,7 +620,7 @@ def describe_value_multiline(x):
     if hasattr(x, 'shape') and hasattr(x, 'dtype'):
         # XXX this fails for bs4, Tag
         if x.shape is not None:
-            shape_desc = 'x'.join(str(i) for i in x.shape)
+            shape_desc = 'x'.join(map(str, x.shape))
             desc = 'array[%r](%s) ' % (shape_desc, x.dtype)
             final = desc + '\n' + x.__repr__()
             return final
@@ -0,0 +1,145 @@
+"""
+Fast-path validators for simple numeric contract strings.
+
+Specs like ``'int,>0'`` or ``'>=1'`` reduce to an isinstance check plus
+one comparison, and type-only specs like ``'str'`` or ``'map'`` to a
+bare isinstance, but normally pay the full Contract dispatch tree on
+every call.  :py:func:`compile_contract` recognizes these degenerate
+specs and builds a plain predicate for them.
+
+The predicate is an *accept-only* fast path: ``True`` means the value
+certainly satisfies the contract and the AST walk can be skipped;
+``False`` means "run the full checker", which re-validates and produces
+the usual friendly :py:class:`ContractNotRespected` error.  This keeps
+error messages and context-variable semantics identical to the slow
+path.
+
+When numba is installed the comparison kernel is lowered with
+``@njit(cache=True)``; numba is not a dependency of this package, so
+its absence (or a compilation failure) silently keeps the pure-Python
+predicate.
+"""
+import operator
+import re
+from collections.abc import Mapping, Sequence, Set
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+__all__ = ['compile_contract', 'numeric_clause']
+
+_TYPES = {
+    'int': int,
+    'float': float,
+    'number': (int, float),
+    None: (int, float),  # bare comparison, e.g. '>0'
+}
+
+# Type-only specs and the isinstance target the library checks them
+# against (strings.py, seq.py, map.py, sets.py, types_misc.py and the
+# int/float aliases in miscellaneous_aliases.py).
+_TYPE_ONLY = {
+    'int': int,
+    'float': float,
+    'number': (int, float),
+    'bool': bool,
+    'str': str,
+    'string': str,
+    'unicode': str,
+    'list': list,
+    'dict': dict,
+    'tuple': tuple,
+    'seq': Sequence,
+    'map': Mapping,
+    'set': Set,
+}
+
+_OPS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '=': operator.eq,
+    '==': operator.eq,
+}
+
+_OP_SOURCE = {'=': '==', '==': '=='}  # the rest map to themselves
+
+# <type>? ,? <op> <number>   --- e.g. 'int,>0', '>=1', 'float,<2.5'
+_SIMPLE = re.compile(r'^\s*(?:(int|float|number)\s*,)?'
+                     r'\s*(>=|<=|==|>|<|=)\s*(-?\d+(?:\.\d+)?)\s*$')
+
+# spec -> predicate or None (None = not a simple numeric spec)
+_cache = {}
+
+
+def _make_predicate(types, op, bound):
+    cmp = _OPS[op]
+    if njit is not None:
+        # Codegen a comparison kernel and lower it; on any numba
+        # bail-out keep the C-level operator.
+        try:
+            source = 'def _cmp(a, b):\n    return a %s b\n' \
+                % _OP_SOURCE.get(op, op)
+            scope = {}
+            exec(compile(source, '<jit_backend>', 'exec'), scope)
+            cmp = njit(cache=True)(scope['_cmp'])
+        except Exception:
+            cmp = _OPS[op]
+
+    def validator(x):
+        # Accept-only: any failure of the kernel (TypeError from odd
+        # operands, OverflowError from an njit'd comparison on ints
+        # wider than 64 bits) defers to the full checker.
+        try:
+            return isinstance(x, types) and cmp(x, bound)
+        except Exception:
+            return False
+
+    return validator
+
+
+def numeric_clause(spec):
+    """ Decomposes a simple numeric spec into (type_name, op, bound),
+        e.g. 'int,>0' -> ('int', '>', 0); None if not of that shape.
+        type_name is None for a bare comparison like '>=1'.
+    """
+    m = _SIMPLE.match(spec)
+    if m is None:
+        return None
+    type_name, op, number = m.groups()
+    bound = float(number) if '.' in number else int(number)
+    return type_name, op, bound
+
+
+def _make_type_predicate(types):
+    def validator(x):
+        return isinstance(x, types)
+
+    return validator
+
+
+def compile_contract(spec):
+    """ Returns an accept-only fast predicate for a type-only or simple
+        numeric contract string, or None if the spec is not of that
+        shape.
+    """
+    try:
+        return _cache[spec]
+    except KeyError:
+        pass
+
+    validator = None
+    key = spec.strip()
+    if key in _TYPE_ONLY:
+        validator = _make_type_predicate(_TYPE_ONLY[key])
+    else:
+        clause = numeric_clause(spec)
+        if clause is not None:
+            type_name, op, bound = clause
+            validator = _make_predicate(_TYPES[type_name], op, bound)
+
+    _cache[spec] = validator
+    return validator
@@ -53,7 +53,7 @@ class Binary(RValue):
             else:
                 return '%s' % x
 
-        s = self.glyph.join(convert(x) for x in self.exprs)
+        s = self.glyph.join(map(convert, self.exprs))
         return s
 
     @staticmethod
@@ -93,7 +93,7 @@ class ShapeContract(Contract):
             else:
                 return "%s" % x
 
-        s = 'x'.join(rep(x) for x in self.dimensions)
+        s = 'x'.join(map(rep, self.dimensions))
         if self.ellipsis:
             s += 'x...'
         return s
@@ -50,7 +50,7 @@ class ArrayLogical(ArrayElementsTest):
             else:
                 return '%s' % x
 
-        s = self.glyph.join(convert(x) for x in self.clauses)
+        s = self.glyph.join(map(convert, self.clauses))
         return s
 
 
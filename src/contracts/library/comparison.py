@@ -27,6 +27,10 @@ class CheckOrder(Contract):
         self.glyph = glyph
         self.expr2 = expr2
         self.smaller, self.equal, self.larger = CheckOrder.conditions[glyph]
+        # == and != only need an equality test, with no number
+        # constraint; decided here once instead of on every check.
+        self.pure_equality = ((self.smaller, self.equal, self.larger)
+                              in ((False, True, False), (True, False, True)))
 
     def check_contract(self, context, value, silent):
         if self.expr1 is None:
@@ -40,14 +44,7 @@ class CheckOrder(Contract):
 
         # Check if we only need to check equality
         # in that case, we don't care for the type
-
-        # FIXME: add support for != here
-        pure_equality = (
-            (self.smaller, self.equal, self.larger) == (False, True, False)
-            or
-            (self.smaller, self.equal, self.larger) == (True, False, True))
-
-        if pure_equality:
+        if self.pure_equality:
             # but we want them to be either numbers or same type
             if (not (isnumber(val1) and isnumber(val2))) and \
                 (not isinstance(val1, val2.__class__)):
@@ -14,7 +14,7 @@ class Logical(object):
         self.precedence = precedence
 
     def __str__(self):
-        s = self.glyph.join(self._convert(x) for x in self.clauses)
+        s = self.glyph.join(map(self._convert, self.clauses))
         return s
 
     def _convert(self, x):
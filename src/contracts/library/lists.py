@@ -1,6 +1,92 @@
 from ..interface import Contract, ContractNotRespected
+from ..jit_backend import numeric_clause
 from ..syntax import (add_contract, W, contract_expression, O, S, add_keyword,
     Keyword)
+import operator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+_OPS = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '=': operator.eq,
+    '==': operator.eq,
+}
+
+# numpy dtype kinds a clause type may batch-validate; anything else
+# (bool, object, strings, overflowing ints) falls back to the
+# element-by-element checker.
+_KINDS = {'int': 'i', 'float': 'f', 'number': 'if', None: 'if'}
+
+# isinstance targets for the codegen'd loop predicate.
+_CLAUSE_TYPES = {'int': int, 'float': float,
+                 'number': (int, float), None: (int, float)}
+
+_SOURCE_OPS = {'=': '==', '==': '=='}  # the rest map to themselves
+
+
+def _codegen_loop_predicate(type_name, op, bound):
+    """ Generates one function whose loop body inlines the type check
+        and the comparison, so validating N elements costs one Python
+        frame instead of N predicate calls. """
+    source = ('def _pred(xs, _t=_t):\n'
+              '    for v in xs:\n'
+              '        if not (isinstance(v, _t) and v %s %r):\n'
+              '            return False\n'
+              '    return True\n'
+              % (_SOURCE_OPS.get(op, op), bound))
+    scope = {'_t': _CLAUSE_TYPES[type_name]}
+    exec(compile(source, '<lists-batch>', 'exec'), scope)
+    return scope['_pred']
+
+# element-spec string -> batch validator or None.  Keyed by string (not
+# stored on the instance) so List contracts stay pickleable.
+_batch_cache = {}
+
+
+def _batch_validator(spec):
+    """ Accept-only validator over the whole list for simple numeric
+        element contracts like 'int,>0'; None when unsupported.  A False
+        result only means "use the element-by-element checker". """
+    try:
+        return _batch_cache[spec]
+    except KeyError:
+        pass
+
+    validator = None
+    clause = numeric_clause(spec)
+    if clause is not None:
+        type_name, op, bound = clause
+        cmp = _OPS[op]
+        if numpy is not None:
+            kinds = _KINDS[type_name]
+
+            def validator(value):
+                # Any conversion/comparison surprise (ragged nests make
+                # asarray raise ValueError on numpy >= 1.24) just means
+                # "use the element-by-element checker".
+                try:
+                    a = numpy.asarray(value)
+                    # A nested list of numbers converts to a 2-D numeric
+                    # array whose elements would wrongly pass; only a
+                    # flat array matches the element contract.
+                    if a.ndim != 1 or a.dtype.kind not in kinds:
+                        return False
+                    return bool(cmp(a, bound).all())
+                except Exception:
+                    return False
+
+        else:
+            validator = _codegen_loop_predicate(type_name, op, bound)
+
+    _batch_cache[spec] = validator
+    return validator
 
 
 class List(Contract):
@@ -10,6 +96,10 @@ class List(Contract):
         Contract.__init__(self, where)
         self.length_contract = length_contract
         self.elements_contract = elements_contract
+        if elements_contract is not None:
+            self._elements_spec = str(elements_contract)
+        else:
+            self._elements_spec = None
 
     def check_contract(self, context, value, silent):
         if not isinstance(value, list):
@@ -20,6 +110,9 @@ class List(Contract):
             self.length_contract._check_contract(context, len(value), silent)
 
         if self.elements_contract is not None:
+            fast = _batch_validator(self._elements_spec)
+            if fast is not None and fast(value):
+                return
             for element in value:
                 self.elements_contract._check_contract(context, element, silent)
 
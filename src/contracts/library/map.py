@@ -4,6 +4,25 @@ from ..syntax import (W, contract_expression, O, S, add_contract, add_keyword,
 import collections
 from ..py_compatibility import Sequence, MutableMapping, Mapping, Set, MutableSet
 
+from functools import singledispatch
+
+from ..utils import memoized_isinstance
+
+_isinstance_mapping = memoized_isinstance(Mapping)
+
+
+@singledispatch
+def _is_mapping(value):
+    # Fallback for unregistered types; the ABC answer is memoized per
+    # concrete type, so the walk happens once.
+    return _isinstance_mapping(value)
+
+
+def _yes(value):
+    return True
+
+_is_mapping.register(dict, _yes)
+
 
 class Map(Contract):
 
@@ -14,7 +33,7 @@ class Map(Contract):
         self.value_c = value_c
 
     def check_contract(self, context, value, silent):
-        if not isinstance(value, Mapping):
+        if not _is_mapping(value):
             error = 'Expected a Mapping, got %r.' % value.__class__.__name__
             raise ContractNotRespected(contract=self, error=error,
                                        value=value, context=context)
@@ -16,6 +16,27 @@ try:
 except:
     has_numpy = False
 
+from functools import singledispatch
+
+from ..utils import memoized_isinstance
+
+_isinstance_sequence = memoized_isinstance(Sequence)
+
+
+@singledispatch
+def _is_sequence(value):
+    # Unregistered types fall back to the ABC check, whose answer is
+    # memoized per concrete type; singledispatch caches the dispatch,
+    # so repeat checks never redo the MRO walk.
+    return _isinstance_sequence(value)
+
+
+def _yes(value):
+    return True
+
+for _t in (list, tuple, str, bytes, bytearray, range):
+    _is_sequence.register(_t, _yes)
+
 
 class Seq(Contract):
 
@@ -44,7 +65,7 @@ class Seq(Contract):
 
             return
 
-        if not isinstance(value, Sequence):
+        if not _is_sequence(value):
             error = 'Expected a Sequence, got %r.' % value.__class__.__name__
             raise ContractNotRespected(self, error, value, context)
 
@@ -4,6 +4,26 @@ from ..syntax import (Keyword, O, S, W, add_contract, add_keyword,
 import collections
 from ..py_compatibility import Sequence, MutableMapping, Mapping, Set, MutableSet
 
+from functools import singledispatch
+
+from ..utils import memoized_isinstance
+
+_isinstance_set = memoized_isinstance(Set)
+
+
+@singledispatch
+def _is_a_set(value):
+    # Fallback for unregistered types; the ABC answer is memoized per
+    # concrete type, so the walk happens once.
+    return _isinstance_set(value)
+
+
+def _yes(value):
+    return True
+
+_is_a_set.register(set, _yes)
+_is_a_set.register(frozenset, _yes)
+
 
 class ASet(Contract):
 
@@ -14,7 +34,7 @@ class ASet(Contract):
         self.elements_contract = elements_contract
 
     def check_contract(self, context, value, silent):
-        if not isinstance(value, Set):
+        if not _is_a_set(value):
             error = 'Expected a set, got %r.' % describe_type(value)
             raise ContractNotRespected(self, error, value, context)
 
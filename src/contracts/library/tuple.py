@@ -51,7 +51,7 @@ class Tuple(Contract):
                 return "%s" % x
 
         if self.elements is not None:
-            s += '(%s)' % ",".join(rep(x) for x in self.elements)
+            s += '(%s)' % ",".join(map(rep, self.elements))
         return s
 
     @staticmethod
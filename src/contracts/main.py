@@ -1,10 +1,12 @@
 from __future__ import unicode_literals
+from functools import lru_cache
+from inspect import signature
 import sys
 import types
 
 import six
 
-from .backported import getcallargs, getfullargspec
+from .backported import getfullargspec
 from .docstring_parsing import Arg, DocStringInfo
 from .enabling import all_disabled
 from .inspection import (can_accept_at_least_one_argument, can_accept_self,
@@ -12,6 +14,7 @@ from .inspection import (can_accept_at_least_one_argument, can_accept_self,
 from .interface import (CannotDecorateClassmethods, Contract,
     ContractDefinitionError, ContractException, ContractNotRespected,
     ContractSyntaxError, MissingContract, Where, describe_value)
+from .jit_backend import compile_contract
 
 
 # from .library import (CheckCallable, Extension, SeparateContext,
@@ -236,8 +239,27 @@ you can achieve the same goal by inverting the two decorators:
     accepts_parsed = dict([(x, parse_flexible_spec(accepts_dict[x]))
                            for x in accepts_dict])
 
+    # Accept-only fast predicates for simple numeric specs like 'int,>0';
+    # if the predicate returns True the AST walk is skipped, otherwise
+    # the full checker runs and produces the usual error.
+    fast_accepts = {}
+    for x in accepts_dict:
+        if is_param_string(accepts_dict[x]):
+            fast = compile_contract(accepts_dict[x])
+            if fast is not None:
+                fast_accepts[x] = fast
+    if returns is not None and is_param_string(returns):
+        fast_returns = compile_contract(returns)
+    else:
+        fast_returns = None
+
     is_bound_method = 'self' in all_args
 
+    # The signature is inspected once here; each call only binds the
+    # arguments against it.  getcallargs re-ran the full argspec
+    # inspection on every invocation.
+    function_signature = signature(function_)
+
     def contracts_checker(unused, *args, **kwargs):
         do_checks = not all_disabled()
         if not do_checks:
@@ -250,7 +272,9 @@ you can achieve the same goal by inverting the two decorators:
                 nice_function_display = klass + ':' + nice_function_display
             return nice_function_display
 
-        bound = getcallargs(function_, *args, **kwargs)
+        bound_arguments = function_signature.bind(*args, **kwargs)
+        bound_arguments.apply_defaults()
+        bound = bound_arguments.arguments
 
         context = {}
         # add self if we are a bound method
@@ -259,6 +283,9 @@ you can achieve the same goal by inverting the two decorators:
 
         for arg in all_args:
             if arg in accepts_parsed:
+                fast = fast_accepts.get(arg)
+                if fast is not None and fast(bound[arg]):
+                    continue
                 try:
                     accepts_parsed[arg]._check_contract(context, bound[arg], silent=False)
                 except ContractNotRespected as e:
@@ -269,7 +296,8 @@ you can achieve the same goal by inverting the two decorators:
 
         result = function_(*args, **kwargs)
 
-        if returns_parsed is not None:
+        if returns_parsed is not None and not (
+                fast_returns is not None and fast_returns(result)):
             try:
                 returns_parsed._check_contract(context, result, silent=False)
             except ContractNotRespected as e:
@@ -665,7 +693,31 @@ def new_contract_impl(identifier, condition):
     return contract
 
 
-def parse_contract_string(string):
+# Specs that appear as cache keys on almost every call site.  Literals
+# with ',' or '>' are not auto-interned by the compiler, so lookups pay
+# a character compare; interning makes them a pointer compare.
+_KNOWN_SPECS = frozenset(map(sys.intern, [
+    'int', 'float', 'number', 'bool', 'str', 'list', 'dict', 'tuple',
+    'set', 'map', 'seq', '>0', '>=0', 'int,>0', 'int,>=0',
+]))
+
+
+@lru_cache(maxsize=4096)
+def _parse_contract_string_cached(string):
     from .main_actual import parse_contract_string_actual
     return parse_contract_string_actual(string)
 
+
+def parse_contract_string(string):
+    check_param_is_string(string)
+    if '$' in string:
+        # Scoped-variable specs are not cacheable (see _cacheable).
+        from .main_actual import parse_contract_string_actual
+        return parse_contract_string_actual(string)
+    if string in _KNOWN_SPECS:
+        string = sys.intern(string)
+    # Contracts are immutable value objects, so identical spec strings
+    # can share one parse; syntax errors are not cached by lru_cache
+    # and re-raise normally.
+    return _parse_contract_string_cached(string)
+
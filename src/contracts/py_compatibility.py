@@ -1,104 +1,81 @@
 """
-Compatibility utilities for PyContracts to work with both Python 2 and 3.
+Compatibility utilities for PyContracts.
+
+The package only supports Python 3 now; the PY3/PY3_12_PLUS flags and
+the aliases below are kept as the stable import surface for code that
+was written against the old two-branch module.
 """
 import sys
-import collections
 
-# Python 2/3 string/bytes compatibility
 PY3 = sys.version_info[0] >= 3
 PY3_12_PLUS = sys.version_info >= (3, 12)
 
-# String types compatibility
-if PY3:
-    string_types = (str,)
-    text_type = str
-    binary_type = bytes
-else:
-    string_types = (basestring,)
-    text_type = unicode
-    binary_type = str
+# String types: on Python 3 these are plain aliases.  A bare type (not
+# a 1-tuple) lets isinstance take the single-type fast path.
+string_types = str
+text_type = str
+binary_type = bytes
+
+# Collection ABCs (re-exported because Python 3.12 removed the old
+# collections-level aliases) and the IO classes are provided lazily via
+# PEP 562: importing this module alone no longer pays for them, and the
+# first attribute access resolves and caches the real object.
+_LAZY_ATTRS = {
+    'Sequence': 'collections.abc',
+    'MutableSequence': 'collections.abc',
+    'Mapping': 'collections.abc',
+    'MutableMapping': 'collections.abc',
+    'Set': 'collections.abc',
+    'MutableSet': 'collections.abc',
+    'Iterable': 'collections.abc',
+    'Container': 'collections.abc',
+    'Sized': 'collections.abc',
+    'StringIO': 'io',
+    'BytesIO': 'io',
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError('module %r has no attribute %r'
+                             % (__name__, name))
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # later lookups bypass this hook
+    return value
 
-# Collection ABC types compatibility
-try:
-    # Python 3.12+ removed these from collections
-    from collections.abc import (
-        Sequence, MutableSequence, 
-        Mapping, MutableMapping,
-        Set, MutableSet,
-        Iterable, Container, Sized
-    )
-except ImportError:
-    # Python 2 compatibility
-    Sequence = collections.Sequence
-    MutableSequence = collections.MutableSequence
-    Mapping = collections.Mapping
-    MutableMapping = collections.MutableMapping
-    Set = collections.Set
-    MutableSet = collections.MutableSet
-    Iterable = collections.Iterable
-    Container = collections.Container
-    Sized = collections.Sized
 
-# StringIO compatibility
-try:
-    from io import StringIO, BytesIO
-except ImportError:
-    # Python 2
-    from StringIO import StringIO
-    from cStringIO import StringIO as BytesIO
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Exception handling compatibility
-if PY3:
-    def reraise(exception, traceback=None):
-        """Re-raise exception with optional traceback in Python 3."""
-        if traceback is not None and exception.__traceback__ is not traceback:
-            raise exception.with_traceback(traceback)
+
+def reraise(exception, traceback=None):
+    """Re-raise exception with an optional traceback, using the native
+    Python 3 raise statement."""
+    if traceback is None:
         raise exception
-        
-    def catch_and_wrap(func, exceptions, wrapper_exception, msg_func=None):
-        """Catch exceptions and wrap them in Python 3."""
-        try:
-            return func()
-        except exceptions as e:
-            if msg_func:
-                msg = msg_func(e)
-            else:
-                msg = str(e)
-            wrapped = wrapper_exception(msg)
-            raise wrapped from e
-else:
-    # Python 2
-    exec("""def reraise(exception, traceback=None):
-        if traceback is None:
-            raise exception
-        else:
-            raise exception, None, traceback
-    """)
-    
-    def catch_and_wrap(func, exceptions, wrapper_exception, msg_func=None):
-        """Catch exceptions and wrap them in Python 2."""
-        try:
-            return func()
-        except exceptions as e:
-            if msg_func:
-                msg = msg_func(e)
-            else:
-                msg = str(e)
-            wrapped = wrapper_exception(msg)
-            reraise(wrapped)
-    
+    raise exception.with_traceback(traceback)
+
+
+def catch_and_wrap(func, exceptions, wrapper_exception, msg_func=None):
+    """Catch exceptions and wrap them in wrapper_exception."""
+    # Resolve the message function before the try so the handler is a
+    # single call with no branch.
+    if msg_func is None:
+        msg_func = str
+    try:
+        return func()
+    except exceptions as e:
+        raise wrapper_exception(msg_func(e)) from e
+
 
-# Print function compatibility for Python 2
-if not PY3:
-    # These are needed for Python 2
-    import copy_reg
-    import types
-    
-    def _reduce_method(m):
-        """Helper function for Python 2 pickling of methods."""
-        if m.__self__ is None:
-            return getattr, (m.__self__.__class__, m.__func__.__name__)
-        else:
-            return getattr, (m.__self__, m.__func__.__name__)
-    
-    copy_reg.pickle(types.MethodType, _reduce_method)
\ No newline at end of file
+def catch_and_wrap_default(func, exceptions, wrapper_exception):
+    """catch_and_wrap without the msg_func branch, for the common case
+    where the wrapped message is just str(e).  Used on the contract
+    checking hot path."""
+    try:
+        return func()
+    except exceptions as e:
+        raise wrapper_exception(str(e)) from e
\ No newline at end of file
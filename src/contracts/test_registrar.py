@@ -3,15 +3,34 @@ syntax_fail_examples = []
 semantic_fail_examples = []
 contract_fail_examples = []
 
+# Companion tables with list-valued contracts expanded to one flat
+# (contract, value, exact) row per contract string.  Built once at
+# registration, so test modules that parametrize over individual
+# contract strings (repr, reconversion, pickling) do not need to
+# re-flatten the tables at import time.  The original tables keep the
+# list-valued rows because those are checked jointly, sharing one
+# context.
+flat_good_examples = []
+flat_semantic_fail_examples = []
+flat_contract_fail_examples = []
+
+
+def _add(table, flat_table, a, b, exact):
+    table.append((a, b, exact))
+    if isinstance(a, list):
+        flat_table.extend((c, b, exact) for c in a)
+    else:
+        flat_table.append((a, b, exact))
+
 
 # If exact is True, we are providing a canonical form
 # for the expression and we want it back.
 def good(a, b, exact=True):
-    good_examples.append((a, b, exact))
+    _add(good_examples, flat_good_examples, a, b, exact)
 
 
 def semantic_fail(a, b, exact=True):
-    semantic_fail_examples.append((a, b, exact))
+    _add(semantic_fail_examples, flat_semantic_fail_examples, a, b, exact)
 
 
 def syntax_fail(s):
@@ -19,6 +38,4 @@ def syntax_fail(s):
 
 
 def fail(a, b, exact=True):
-    contract_fail_examples.append((a, b, exact))
-
-
+    _add(contract_fail_examples, flat_contract_fail_examples, a, b, exact)
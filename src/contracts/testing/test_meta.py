@@ -4,21 +4,47 @@ import pytest
 
 from contracts import ContractNotRespected, contract, ContractsMeta
 from contracts import CannotDecorateClassmethods
-from contracts import with_metaclass
 
 
-class TestMeta:
+# The abstract bases are defined once at module scope: they only need
+# the metaclass machinery (and the parsing of '>0') to run a single
+# time, not on every test invocation.
 
-    def test_meta_still_works1(self):
+class A1(metaclass=ContractsMeta):
 
-        class A(with_metaclass(ContractsMeta, object)):
+    @abstractmethod
+    @contract(a='>0')
+    def f(self, a):
+        pass
 
-            @abstractmethod
-            @contract(a='>0')
-            def f(self, a):
-                pass
 
-        class B(A):
+class A2(metaclass=ContractsMeta):
+
+    # inverse order
+    @contract(a='>0')
+    @abstractmethod
+    def f(self, a):
+        pass
+
+
+class A3(metaclass=ContractsMeta):
+
+    @abstractmethod
+    @contract(a='>0')
+    def f(self, a):
+        pass
+
+    @contract(a='>0')
+    @abstractmethod
+    def g(self, a):
+        pass
+
+
+class TestMeta:
+
+    def test_meta_still_works1(self):
+
+        class B(A1):
             # does not implement f
             pass
 
@@ -27,15 +53,7 @@ class TestMeta:
 
     def test_meta_still_works2(self):
 
-        class A(with_metaclass(ContractsMeta, object)):
-
-            # inverse order
-            @contract(a='>0')
-            @abstractmethod
-            def f(self, a):
-                pass
-
-        class B(A):
+        class B(A2):
             # does not implement f
             pass
 
@@ -44,20 +62,7 @@ class TestMeta:
 
     def test_meta1(self):
 
-        class A(with_metaclass(ContractsMeta, object)):
-
-            @abstractmethod
-            @contract(a='>0')
-            def f(self, a):
-                pass
-
-
-            @contract(a='>0')
-            @abstractmethod
-            def g(self, a):
-                pass
-
-        class B(A):
+        class B(A3):
 
             def f(self, a):
                 pass
@@ -75,7 +80,7 @@ class TestMeta:
     @pytest.mark.xfail(reason="Known issue with static methods")
     def test_static1(self):
 
-        class A(with_metaclass(ContractsMeta, object)):
+        class A(metaclass=ContractsMeta):
 
             @staticmethod
             @contract(a='>0')
@@ -97,7 +102,7 @@ class TestMeta:
     @pytest.mark.xfail(reason="Known issue with class methods")
     def test_classmethod1(self):
 
-        class A(with_metaclass(ContractsMeta, object)):
+        class A(metaclass=ContractsMeta):
 
             @classmethod
             @contract(a='>0')
@@ -121,7 +126,7 @@ class TestMeta:
     @pytest.mark.xfail(reason="Known issue with class methods")
     def test_classmethod1ns(self):
 
-        class A(with_metaclass(ContractsMeta, object)):
+        class A(metaclass=ContractsMeta):
 
             @classmethod
             @contract(a='>0')
@@ -147,7 +152,7 @@ class TestMeta:
 
         def test_classmethod2():
 
-            class A(with_metaclass(ContractsMeta, object)):
+            class A(metaclass=ContractsMeta):
 
                 @contract(a='>0')
                 @classmethod
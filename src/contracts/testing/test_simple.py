@@ -1,9 +1,12 @@
-import traceback
+import functools
 
 from ..main import parse_contract_string
 from ..test_registrar import (good_examples, semantic_fail_examples,
-                              syntax_fail_examples, contract_fail_examples)
-from .utils import check_contracts_ok, check_syntax_fail, check_contracts_fail
+                              syntax_fail_examples, contract_fail_examples,
+                              flat_good_examples, flat_semantic_fail_examples,
+                              flat_contract_fail_examples)
+from .utils import (check_contracts_ok, check_syntax_fail,
+                    check_contracts_fail, cheap_id)
 
 # Import the other tests
 from . import test_multiple  # @UnusedImport
@@ -25,78 +28,77 @@ from ..library import *  # @UnusedWildImport @UnresolvedImport
 
 import pytest
 
-@pytest.mark.parametrize('contract,value,exact', good_examples)
+@pytest.mark.parametrize('contract,value,exact', good_examples, ids=cheap_id)
 def test_good(contract, value, exact):  # @UnusedVariable
     check_contracts_ok(contract, value)
 
 
-@pytest.mark.parametrize('syntax', syntax_fail_examples)
+@pytest.mark.parametrize('syntax', syntax_fail_examples, ids=cheap_id)
 def test_syntax_fail(syntax):
     check_syntax_fail(syntax)
 
 
-@pytest.mark.parametrize('contract,value,exact', semantic_fail_examples)
+@pytest.mark.parametrize('contract,value,exact', semantic_fail_examples, ids=cheap_id)
 def test_semantic_fail(contract, value, exact):  # @UnusedVariable
     check_contracts_fail(contract, value, ContractNotRespected)
 
 
-@pytest.mark.parametrize('contract,value,exact', contract_fail_examples)
+@pytest.mark.parametrize('contract,value,exact', contract_fail_examples, ids=cheap_id)
 def test_contract_fail(contract, value, exact):  # @UnusedVariable
     check_contracts_fail(contract, value, ContractNotRespected)
 
 
-# Helper function to get all individual contracts for parameterization
-def get_all_repr_contracts():
-    """Helper to get all contracts for repr testing"""
-    contracts = []
-    allc = (good_examples + semantic_fail_examples + contract_fail_examples)
-    for contract, value, exact in allc:  # @UnusedVariable
-        if isinstance(contract, list):
-            contracts.extend(contract)
-        else:
-            contracts.append(contract)
-    return contracts
-
-# Checks that we can eval() the __repr__() value and 
-# we get an equivalent object. 
-@pytest.mark.parametrize('contract', get_all_repr_contracts())
+# The registrar keeps list-valued contracts pre-flattened, so these are
+# plain projections of homogeneous rows.
+_ALL_FLAT = (flat_good_examples + flat_semantic_fail_examples +
+             flat_contract_fail_examples)
+_ALL_CONTRACTS = [contract for contract, _, _ in _ALL_FLAT]
+_RECONVERSION_DATA = [(contract, exact) for contract, _, exact in _ALL_FLAT]
+
+
+# Checks that we can eval() the __repr__() value and
+# we get an equivalent object.
+@pytest.mark.parametrize('contract', _ALL_CONTRACTS, ids=cheap_id)
 def test_repr(contract):
     check_good_repr(contract)
 
 
-#  Checks that we can reconvert the __str__() value and we get the same. 
-def get_all_reconversion_data():
-    """Helper to get all contracts with exactness flag for reconversion testing"""
-    contract_data = []
-    allc = (good_examples + semantic_fail_examples + contract_fail_examples)
-    for contract, _, exact in allc:
-        if isinstance(contract, list):
-            for c in contract:
-                contract_data.append((c, exact))
-        else:
-            contract_data.append((contract, exact))
-    return contract_data
-
-@pytest.mark.parametrize('contract_data', get_all_reconversion_data())
+#  Checks that we can reconvert the __str__() value and we get the same.
+@pytest.mark.parametrize('contract_data', _RECONVERSION_DATA, ids=cheap_id)
 def test_reconversion(contract_data):
     contract, exact = contract_data
     check_recoversion(contract, exact)
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_cached(s):
+    """Memoized parse: the repr and reconversion tests parse the same
+    strings repeatedly, and parsed contracts are immutable value
+    objects compared by equality, so sharing them is safe."""
+    return parse_contract_string(s)
+
+
+@functools.lru_cache(maxsize=4096)
+def _compile_expr(src):
+    """Compiled code object for a repr expression; many contracts share
+    the same repr fragments, so identical strings compile once."""
+    return compile(src, '<contract-repr>', 'eval')
+
+
 def check_good_repr(c):
     """ Checks that we can eval() the __repr__() value and we get
         an equivalent object. """
-    parsed = parse_contract_string(c)
+    parsed = _parse_cached(c)
     # Check that it compares true with itself
     assert parsed.__eq__(parsed), 'Repr does not know itself: %r' % parsed
 
     reprc = parsed.__repr__()
 
     try:
-        reeval = eval(reprc)
+        reeval = eval(_compile_expr(reprc), globals())
     except Exception as e:
-        traceback.print_exc()
-        raise Exception('Could not evaluate expression %r: %s' % (reprc, e))
+        # pytest shows the chained traceback; no need to print it here.
+        raise Exception('Could not evaluate expression %r: %s' % (reprc, e)) from e
 
     assert reeval == parsed, \
             'Repr gives different object:\n  %r !=\n  %r' % (parsed, reeval)
@@ -105,10 +107,10 @@ def check_good_repr(c):
 def check_recoversion(s, exact):
     """ Checks that we can eval() the __repr__() value and we get
         an equivalent object. """
-    parsed = parse_contract_string(s)
+    parsed = _parse_cached(s)
 
     s2 = parsed.__str__()
-    reconv = parse_contract_string(s2)
+    reconv = _parse_cached(s2)
 
     msg = 'Reparsing gives different objects:\n'
     msg += '  Original string: %r\n' % s
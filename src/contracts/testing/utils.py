@@ -5,6 +5,12 @@ from ..interface import (ContractSyntaxError, describe_value,
 from ..main import parse_contract_string, check_contracts
 
 
+def cheap_id(value):
+    """ Test id for pytest.mark.parametrize that avoids calling the
+        (expensive) __repr__ of parametrized contract values. """
+    return value if isinstance(value, str) else type(value).__name__
+
+
 def check_contracts_ok(contract, value):
     if isinstance(contract, six.string_types):
         contract = [contract]
@@ -17,6 +17,7 @@ __all__ = [
     'raise_wrapped',
     'raise_desc',
     'check_isinstance',
+    'memoized_isinstance',
 ]
 
 
@@ -25,45 +26,65 @@ def indent(s, prefix, first=None):
         s = u'{}'.format(s)
 
     assert isinstance(prefix, string_types)
-    try:
-        lines = s.split('\n')
-    except UnicodeDecodeError:
-        print(type(s)) # XXX
-        print(s) # XXX
-        lines = [s]
-    if not lines:
-        return u''
+    lines = s.split('\n')
 
     if first is None:
         first = prefix
+    else:
+        # Align the two prefixes to the same width.
+        m = max(len(prefix), len(first))
+        prefix = ' ' * (m - len(prefix)) + prefix
+        first = ' ' * (m - len(first)) + first
 
-    m = max(len(prefix), len(first))
-
-    prefix = ' ' * (m - len(prefix)) + prefix
-    first = ' ' * (m - len(first)) + first
-
-    # differnet first prefix
-    res = [u'%s%s' % (prefix, line.rstrip()) for line in lines]
-    res[0] = u'%s%s' % (first, lines[0].rstrip())
-    return '\n'.join(res)
+    res = [first + lines[0].rstrip()]
+    res.extend(prefix + line.rstrip() for line in lines[1:])
+    return u'\n'.join(res)
 
 
 def deprecated(func):
     """This is a decorator which can be used to mark functions
     as deprecated. It will result in a warning being emitted
-    when the function is used."""
+    the first time the function is used."""
+    warned = False
 
     def new_func(*args, **kwargs):
-        warnings.warn("Call to deprecated function %s." % func.__name__,
-                      category=DeprecationWarning, stacklevel=2)
+        nonlocal warned
+        if not warned:
+            warned = True
+            warnings.warn("Call to deprecated function %s." % func.__name__,
+                          category=DeprecationWarning, stacklevel=2)
         return func(*args, **kwargs)
 
+    new_func.__wrapped__ = func
+
     new_func.__name__ = func.__name__
     new_func.__doc__ = func.__doc__
     new_func.__dict__.update(func.__dict__)
     return new_func
 
 
+def memoized_isinstance(abc_type):
+    """ Returns a predicate equivalent to ``isinstance(x, abc_type)``
+        that memoizes the answer per concrete type, so repeated checks
+        skip the ABC __instancecheck__ walk.  The abc registry cache
+        token invalidates the memo if a virtual subclass is registered
+        later. """
+    from abc import get_cache_token
+    cache = {}
+
+    def check(value):
+        t = value.__class__
+        token = get_cache_token()
+        hit = cache.get(t)
+        if hit is not None and hit[0] == token:
+            return hit[1]
+        result = isinstance(value, abc_type)
+        cache[t] = (token, result)
+        return result
+
+    return check
+
+
 def check_isinstance(ob, expected, **kwargs):
     if not isinstance(ob, expected):
         kwargs['object'] = ob
@@ -88,25 +109,19 @@ def format_dict_long(d, informal=False):
     if not d:
         return '{}'
 
-    maxlen = max([len(n) for n in d]) + 2
+    maxlen = max(map(len, d)) + 2
 
     def pad(pre):
         return ' ' * (maxlen - len(pre)) + pre
 
-    res = ""
-    order = sorted(d)
-    for i, name in enumerate(order):
-        value = d[name]
-        prefix = pad('%s: ' % name)
-        if i > 0:
-            res += '\n'
-
-        s = _get_str(value, informal)
-
+    def entry(name):
+        s = _get_str(d[name], informal)
         if len(s) > 512:
             s = s[:512] + ' [truncated]'
-        res += indent(s, ' ', first=prefix)
-    return res
+        return indent(s, ' ', first=pad('%s: ' % name))
+
+    # One join instead of repeated += reallocations.
+    return '\n'.join([entry(name) for name in sorted(d)])
 
 
 def _get_str(x, informal):
@@ -124,14 +139,8 @@ def format_list_long(l, informal=False):
           first
         - Second
     """
-    res = ""
-    for i, value in enumerate(l):
-        prefix = '- '
-        if i > 0:
-            res += '\n'
-        s = _get_str(value, informal)
-        res += indent(s, ' ', first=prefix)
-    return res
+    return '\n'.join([indent(_get_str(value, informal), ' ', first='- ')
+                      for value in l])
 
 
 def format_obs(d, informal=False):
@@ -139,27 +148,14 @@ def format_obs(d, informal=False):
     if not d:
         return d.__str__()
 
-    maxlen = 0
-    for name in d:
-        maxlen = max(len(name), maxlen)
+    maxlen = max(map(len, d))
 
     def pad(pre):
         return ' ' * (maxlen - len(pre)) + pre
 
-    res = ''
-
-    S = sorted(d)
-    for i, name in enumerate(S):
-        value = d[name]
-        prefix = pad('%s: ' % name)
-        if i > 0:
-            res += '\n'
-
-        s = _get_str(value, informal)
-
-        res += indent(s, ' ', first=prefix)
-
-    return res
+    return '\n'.join([indent(_get_str(d[name], informal), ' ',
+                             first=pad('%s: ' % name))
+                      for name in sorted(d)])
 
 
 def raise_wrapped(etype, e, msg, compact=False, **kwargs):
@@ -273,6 +269,9 @@ def raise_desc(etype, msg, args_first=False, **kwargs):
 
 # from decorator import decorator  # @UnresolvedImport
 
+_TYPEERROR_NAME = TypeError.__name__
+
+
 def ignore_typeerror(f):
     """ Recasts TypeError as Exception; otherwise pyparsing gets confused. """
 
@@ -280,6 +279,8 @@ def ignore_typeerror(f):
         try:
             return f(*args, **kwargs)
         except TypeError as e:
-            raise Exception(traceback.format_exc())
+            # Chaining keeps the original traceback; no need to render
+            # the whole stack into the message with format_exc().
+            raise Exception('%s: %s' % (_TYPEERROR_NAME, e)) from e
 
     return f2
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""
+Test that contracts become a no-op under python -O, unless CONTRACTS_FORCE
+is set.  Run in a subprocess because __debug__ is fixed per interpreter.
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+CODE = """
+from contracts import contract
+
+@contract(a='int,>0')
+def f(a):
+    return a
+
+assert not hasattr(f, '__contracts__'), 'expected the undecorated function'
+f(-5)  # must not raise
+print('ok')
+"""
+
+CODE_FORCE = """
+from contracts import contract, ContractNotRespected
+
+@contract(a='int,>0')
+def f(a):
+    return a
+
+try:
+    f(-5)
+except ContractNotRespected:
+    print('raised')
+else:
+    print('no-raise')
+"""
+
+
+def _run_optimized(code, **env_overrides):
+    env = dict(os.environ)
+    env.pop('CONTRACTS_FORCE', None)
+    env.pop('DISABLE_CONTRACTS', None)
+    env.update(env_overrides)
+    return subprocess.run([sys.executable, '-O', '-c', code],
+                          capture_output=True, text=True, env=env)
+
+
+def test_optimized_mode_disables_contracts():
+    """Under -O the decorator returns the function untouched."""
+    result = _run_optimized(CODE)
+    assert result.returncode == 0, result.stderr
+    assert 'ok' in result.stdout
+
+
+def test_contracts_force_keeps_validation():
+    """CONTRACTS_FORCE=1 keeps checking even under -O."""
+    result = _run_optimized(CODE_FORCE, CONTRACTS_FORCE='1')
+    assert result.returncode == 0, result.stderr
+    assert 'raised' in result.stdout
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
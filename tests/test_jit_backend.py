@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Tests for the simple-numeric fast-path validators in contracts.jit_backend.
+"""
+import pytest
+from contracts import contract, ContractNotRespected
+from contracts.jit_backend import compile_contract
+
+
+def test_simple_specs_recognized():
+    """Specs like 'int,>0' compile to a direct predicate."""
+    v = compile_contract('int,>0')
+    assert v is not None
+    assert v(5)
+    assert not v(0)
+    assert not v(-1)
+    assert not v('hello')
+
+
+def test_bare_comparison():
+    """A bare comparison accepts any number satisfying it."""
+    v = compile_contract('>=1')
+    assert v(1)
+    assert v(2.5)
+    assert not v(0)
+    assert not v([])
+
+
+def test_type_only_specs():
+    """Type-only specs compile to a bare isinstance predicate."""
+    v = compile_contract('str')
+    assert v is not None
+    assert v('hello')
+    assert not v(5)
+
+    v = compile_contract('map')
+    assert v({'a': 1})
+    assert not v([1, 2])
+
+
+def test_unrecognized_specs_fall_back():
+    """Anything beyond a type or type-plus-comparison is left to the
+    full checker."""
+    assert compile_contract('list[N](int),N>0') is None
+    assert compile_contract('str[2]') is None
+    assert compile_contract('map(str:seq)') is None
+
+
+def test_decorated_function_behavior_unchanged():
+    """The fast path is accept-only: failures still raise the usual error."""
+    @contract(a='int,>0')
+    def f(a):
+        return a
+
+    assert f(3) == 3
+    with pytest.raises(ContractNotRespected):
+        f(-1)
+    with pytest.raises(ContractNotRespected):
+        f('x')
+
+
+def test_big_int_does_not_break_accept_only_promise():
+    """Ints wider than 64 bits overflow an njit'd kernel; the validator
+    must defer to the full checker instead of raising."""
+    @contract(a='int,>0')
+    def f(a):
+        return a
+
+    big = 2 ** 100
+    assert f(big) == big
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+"""
+Tests for the batch list validator in contracts.library.lists.
+"""
+import pytest
+from contracts import parse, ContractNotRespected
+from contracts.library import lists
+
+
+def test_batch_accepts_flat_numeric_list():
+    """The happy path: a flat list of conforming numbers passes."""
+    parse('list(int,>0)').check([1, 2, 3])
+    parse('list(float,<2.5)').check([0.5, 1.5])
+
+
+def test_nested_list_still_rejected():
+    """A rectangular nest of numbers must not slip through the batch
+    path: the elements are lists, not ints."""
+    with pytest.raises(ContractNotRespected):
+        parse('list(int,>0)').check([[1, 2], [3, 4]])
+
+
+def test_ragged_nested_list_raises_contract_error():
+    """A ragged numeric nest must raise ContractNotRespected, not leak
+    a ValueError from numpy.asarray."""
+    with pytest.raises(ContractNotRespected):
+        parse('list(int,>0)').check([[1], [2, 3]])
+
+
+def test_numpy_validator_requires_flat_array():
+    """The numpy branch only accepts 1-D arrays of the right kind and
+    treats any conversion surprise as a fall-back."""
+    numpy = pytest.importorskip('numpy')
+    assert lists.numpy is not None
+
+    lists._batch_cache.pop('int,>0', None)
+    v = lists._batch_validator('int,>0')
+    assert v([1, 2, 3])
+    assert not v([0, 1])
+    assert not v([[1, 2], [3, 4]])  # 2-D: defer to the element checker
+    assert not v([[1], [2, 3]])  # ragged: asarray may raise
+    assert not v([1.5, 2.5])  # wrong dtype kind
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])